@@ -88,10 +88,26 @@ class SampleParquetTargetSink(BatchSink):
 
     max_size = 100000  # Max records to write in any batch
 
+    _arrow_schema: pa.Schema | None = None
+
+    @property
+    def arrow_schema(self) -> pa.Schema:
+        """Get the Arrow schema for the stream.
+
+        The schema is converted from the stream's JSON Schema once and reused for
+        every batch.
+
+        Returns:
+            The Arrow schema.
+        """
+        if self._arrow_schema is None:
+            self._arrow_schema = json_schema_to_arrow(self.schema)
+        return self._arrow_schema
+
     def process_batch(self, context: dict) -> None:
         """Write any prepped records out and return only once fully written."""
         records_to_drain = context["records"]
-        schema = json_schema_to_arrow(self.schema)
+        schema = self.arrow_schema
         writer = pq.ParquetWriter(self.config["filepath"], schema)
 
         table = pa.Table.from_pylist(records_to_drain, schema=schema)
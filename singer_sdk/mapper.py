@@ -321,7 +321,7 @@ class CustomStreamMap(StreamMap):
             result: str | int | float = simpleeval.simple_eval(
                 expr, functions=self.functions, names=names
             )
-            logging.debug(f"Eval result: {expr} = {result}")
+            logging.debug("Eval result: %s = %s", expr, result)
         except Exception as ex:
             raise MapExpressionError(
                 f"Failed to evaluate simpleeval expressions {expr}."
@@ -464,8 +464,10 @@ class CustomStreamMap(StreamMap):
                     expr=filter_rule, record=record, property_name=None
                 )
                 logging.debug(
-                    f"Filter result for '{filter_rule}' "
-                    "in '{self.name}' stream: {filter_result}"
+                    "Filter result for '%s' in '%s' stream: %s",
+                    filter_rule,
+                    self.stream_alias,
+                    filter_result,
                 )
                 if not filter_result:
                     logging.debug("Excluding record due to filter.")
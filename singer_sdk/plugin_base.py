@@ -238,7 +238,7 @@ class PluginBase(metaclass=abc.ABCMeta):
             self.append_builtin_config(config_jsonschema)
             try:
                 self.logger.debug(
-                    f"Validating config using jsonschema: {config_jsonschema}"
+                    "Validating config using jsonschema: %s", config_jsonschema
                 )
                 validator = JSONSchemaValidator(config_jsonschema)
                 validator.validate(self._config)
@@ -352,7 +352,7 @@ class PluginBase(metaclass=abc.ABCMeta):
             # Empty list for string parts
             md_list = []
             # Get required settings for table
-            required_settings = info["settings"].get("required", [])
+            required_settings = set(info["settings"].get("required", []))
 
             # Iterate over Dict to set md
             md_list.append(
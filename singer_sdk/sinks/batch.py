@@ -66,10 +66,11 @@ class BatchSink(Sink):
             record: Individual record in the stream.
             context: Stream partition or context dictionary.
         """
-        if "records" not in context:
-            context["records"] = []
+        records = context.get("records")
+        if records is None:
+            records = context["records"] = []
 
-        context["records"].append(record)
+        records.append(record)
 
     @abc.abstractmethod
     def process_batch(self, context: dict) -> None:
@@ -3,9 +3,10 @@
 import abc
 import datetime
 import time
+from functools import lru_cache
 from logging import Logger
 from types import MappingProxyType
-from typing import Any, Dict, List, Mapping, Optional, Union
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
 from dateutil import parser
 from jsonschema import Draft4Validator, FormatChecker
@@ -20,6 +21,91 @@ from singer_sdk.plugin_base import PluginBase
 
 JSONSchemaValidator = Draft4Validator
 
+_TIMESTAMP_PARSE_CACHE_SIZE = 4096
+_ISO_DATETIME_SEPARATORS = ("", "T", " ")
+
+# Record metadata columns, documented at:
+# https://sdk.meltano.com/en/latest/implementation/record_metadata.md
+_SDC_DATETIME_COLUMNS = (
+    "_sdc_extracted_at",
+    "_sdc_received_at",
+    "_sdc_batched_at",
+    "_sdc_deleted_at",
+)
+_SDC_INTEGER_COLUMNS = ("_sdc_sequence", "_sdc_table_version")
+_SDC_COLUMNS = _SDC_DATETIME_COLUMNS + _SDC_INTEGER_COLUMNS
+
+
+def _parse_iso_timestamp(value: str) -> Optional[datetime.datetime]:
+    """Parse an ISO 8601 date or date-time string with the standard library.
+
+    `datetime.fromisoformat()` accepts any character as the date/time separator,
+    so only values separated by "T" or a space (or bare dates) are parsed here.
+    Other values, such as "2022-01-01_12:34:56", are left for `dateutil` to reject.
+
+    Args:
+        value: The date or date-time string to parse.
+
+    Returns:
+        The parsed datetime value, or None if `value` is not an ISO 8601 string.
+    """
+    if value[10:11] not in _ISO_DATETIME_SEPARATORS:
+        return None
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=_TIMESTAMP_PARSE_CACHE_SIZE)
+def _parse_iso_timestamp_cached(value: str) -> Optional[datetime.datetime]:
+    """Parse an ISO 8601 string, memoizing results for repeated values.
+
+    Parsed `datetime` objects are immutable, so they can safely be shared between
+    records. Only the standard library parser is memoized: `dateutil` fills in
+    missing fields from the current date, so its results must not outlive the call.
+
+    Args:
+        value: The date or date-time string to parse.
+
+    Returns:
+        The parsed datetime value, or None if `value` is not an ISO 8601 string.
+    """
+    return _parse_iso_timestamp(value)
+
+
+def _parse_timestamp(value: str) -> datetime.datetime:
+    """Parse a date or date-time string.
+
+    ISO 8601 strings, the common case, are handled by the much faster standard
+    library parser. Anything else falls back to `dateutil`.
+
+    Args:
+        value: The date or date-time string to parse.
+
+    Returns:
+        The parsed datetime value.
+    """
+    parsed = _parse_iso_timestamp(value)
+    if parsed is None:
+        parsed = parser.parse(value)
+    return parsed
+
+
+def _parse_timestamp_cached(value: str) -> datetime.datetime:
+    """Parse a date or date-time string, memoizing ISO 8601 results.
+
+    Args:
+        value: The date or date-time string to parse.
+
+    Returns:
+        The parsed datetime value.
+    """
+    parsed = _parse_iso_timestamp_cached(value)
+    if parsed is None:
+        parsed = parser.parse(value)
+    return parsed
+
 
 class Sink(metaclass=abc.ABCMeta):
     """Abstract base class for target sinks."""
@@ -47,9 +133,12 @@ class Sink(metaclass=abc.ABCMeta):
         """
         self.logger = target.logger
         self._config = dict(target.config)
+        self._config_proxy: Mapping[str, Any] = MappingProxyType(self._config)
         self._pending_batch: Optional[dict] = None
+        self._batch_start_time: Optional[datetime.datetime] = None
+        self._batched_at: Optional[str] = None
         self.stream_name = stream_name
-        self.logger.info(f"Initializing target sink for stream '{stream_name}'...")
+        self.logger.info("Initializing target sink for stream '%s'...", stream_name)
         self.schema = schema
         if self.include_sdc_metadata_properties:
             self._add_sdc_metadata_to_schema()
@@ -70,6 +159,8 @@ class Sink(metaclass=abc.ABCMeta):
         self._batch_dupe_records_merged: int = 0
 
         self._validator = Draft4Validator(schema, format_checker=FormatChecker())
+        self._datelike_fields = self._get_datelike_fields(schema)
+        self._parse_timestamp_str: Optional[Callable[[str], datetime.datetime]] = None
 
     def _get_context(self, record: dict) -> dict:
         """Return an empty dictionary by default.
@@ -161,7 +252,7 @@ class Sink(metaclass=abc.ABCMeta):
         Returns:
             A frozen (read-only) config dictionary map.
         """
-        return MappingProxyType(self._config)
+        return self._config_proxy
 
     @property
     def include_sdc_metadata_properties(self) -> bool:
@@ -181,6 +272,22 @@ class Sink(metaclass=abc.ABCMeta):
         """
         return DatetimeErrorTreatmentEnum.ERROR
 
+    @property
+    def cache_parsed_timestamps(self) -> bool:
+        """Check if parsed date-like values should be memoized across records.
+
+        Streams commonly repeat the same timestamp strings across many records, so
+        caching is enabled by default. Set `cache_parsed_timestamps=False` in config
+        (or override this property) for streams with mostly unique values.
+
+        Only ISO 8601 values are cached. Values parsed by `dateutil`, which may be
+        completed from the current date (e.g. "Jan 5"), are parsed on every record.
+
+        Returns:
+            True if parsed date-like values should be cached.
+        """
+        return self.config.get("cache_parsed_timestamps", True)
+
     # Record processing
 
     def _add_sdc_metadata_to_record(
@@ -196,12 +303,22 @@ class Sink(metaclass=abc.ABCMeta):
             message: TODO
             context: Stream partition or context dictionary.
         """
+        received_at = datetime.datetime.now().isoformat()
+        batch_start_time = context.get("batch_start_time", None)
+        if not batch_start_time:
+            batched_at = received_at
+        else:
+            # All records in a batch share the same batch start time, so only
+            # format it once per batch.
+            if batch_start_time is not self._batch_start_time:
+                self._batch_start_time = batch_start_time
+                self._batched_at = batch_start_time.isoformat()
+            batched_at = self._batched_at
+
         record["_sdc_extracted_at"] = message.get("time_extracted")
-        record["_sdc_received_at"] = datetime.datetime.now().isoformat()
-        record["_sdc_batched_at"] = (
-            context.get("batch_start_time", None) or datetime.datetime.now()
-        ).isoformat()
-        record["_sdc_deleted_at"] = record.get("_sdc_deleted_at")
+        record["_sdc_received_at"] = received_at
+        record["_sdc_batched_at"] = batched_at
+        record.setdefault("_sdc_deleted_at", None)
         record["_sdc_sequence"] = int(round(time.time() * 1000))
         record["_sdc_table_version"] = message.get("version")
 
@@ -212,17 +329,12 @@ class Sink(metaclass=abc.ABCMeta):
         https://sdk.meltano.com/en/latest/implementation/record_metadata.md
         """
         properties_dict = self.schema["properties"]
-        for col in {
-            "_sdc_extracted_at",
-            "_sdc_received_at",
-            "_sdc_batched_at",
-            "_sdc_deleted_at",
-        }:
+        for col in _SDC_DATETIME_COLUMNS:
             properties_dict[col] = {
                 "type": ["null", "string"],
                 "format": "date-time",
             }
-        for col in {"_sdc_sequence", "_sdc_table_version"}:
+        for col in _SDC_INTEGER_COLUMNS:
             properties_dict[col] = {"type": ["null", "integer"]}
 
     def _remove_sdc_metadata_from_schema(self) -> None:
@@ -232,14 +344,7 @@ class Sink(metaclass=abc.ABCMeta):
         https://sdk.meltano.com/en/latest/implementation/record_metadata.md
         """
         properties_dict = self.schema["properties"]
-        for col in {
-            "_sdc_extracted_at",
-            "_sdc_received_at",
-            "_sdc_batched_at",
-            "_sdc_deleted_at",
-            "_sdc_sequence",
-            "_sdc_table_version",
-        }:
+        for col in _SDC_COLUMNS:
             properties_dict.pop(col, None)
 
     def _remove_sdc_metadata_from_record(self, record: dict) -> None:
@@ -270,11 +375,30 @@ class Sink(metaclass=abc.ABCMeta):
             TODO
         """
         self._validator.validate(record)
-        self._parse_timestamps_in_record(
-            record=record, schema=self.schema, treatment=self.datetime_error_treatment
-        )
+        if self._datelike_fields:
+            self._parse_timestamps_in_record(
+                record=record,
+                schema=self.schema,
+                treatment=self.datetime_error_treatment,
+            )
         return record
 
+    def _get_datelike_fields(self, schema: Dict) -> List[Tuple[str, str]]:
+        """Get the date-like properties of a schema.
+
+        Args:
+            schema: Schema to inspect.
+
+        Returns:
+            A list of (property name, date-like type) tuples.
+        """
+        datelike_fields = []
+        for key, property_schema in schema["properties"].items():
+            datelike_type = get_datelike_property_type(property_schema)
+            if datelike_type:
+                datelike_fields.append((key, datelike_type))
+        return datelike_fields
+
     def _parse_timestamps_in_record(
         self, record: Dict, schema: Dict, treatment: DatetimeErrorTreatmentEnum
     ) -> None:
@@ -284,29 +408,46 @@ class Sink(metaclass=abc.ABCMeta):
         is out of range, repair logic will be driven by the `treatment` input arg:
         MAX, NULL, or ERROR.
 
+        Only properties declared as date-like in the sink's schema are visited, so
+        record keys which are not in the schema are left untouched. These properties
+        are found once, when the sink is initialized.
+
         Args:
             record: Individual record in the stream.
-            schema: TODO
-            treatment: TODO
+            schema: Schema of the stream.
+            treatment: How to handle values which cannot be parsed.
         """
-        for key in record.keys():
-            datelike_type = get_datelike_property_type(schema["properties"][key])
-            if datelike_type:
-                try:
-                    date_val = record[key]
-                    if record[key] is not None:
-                        date_val = parser.parse(date_val)
-                except Exception as ex:
-                    date_val = handle_invalid_timestamp_in_record(
-                        record,
-                        [key],
-                        date_val,
-                        datelike_type,
-                        ex,
-                        treatment,
-                        self.logger,
-                    )
-                record[key] = date_val
+        if self._parse_timestamp_str is None:
+            # Resolve the parser once per sink rather than once per record.
+            self._parse_timestamp_str = (
+                _parse_timestamp_cached
+                if self.cache_parsed_timestamps
+                else _parse_timestamp
+            )
+        parse_str = self._parse_timestamp_str
+        for key, datelike_type in self._datelike_fields:
+            date_val = record.get(key)
+            if date_val is None:
+                continue
+
+            try:
+                # Time values are parsed relative to the current date, so they are
+                # neither cached nor parsed as ISO dates.
+                if isinstance(date_val, str) and datelike_type != "time":
+                    date_val = parse_str(date_val)
+                else:
+                    date_val = parser.parse(date_val)
+            except Exception as ex:
+                date_val = handle_invalid_timestamp_in_record(
+                    record,
+                    [key],
+                    date_val,
+                    datelike_type,
+                    ex,
+                    treatment,
+                    self.logger,
+                )
+            record[key] = date_val
 
     def _after_process_record(self, context: dict) -> None:
         """Perform post-processing and record keeping. Internal hook.
@@ -190,10 +190,14 @@ class SQLSink(BatchSink):
             f" VALUES "
             f"({', '.join([':' + n for n in property_names])})"
         )
-        self.connector.connection.execute(
-            insert_sql,
-            records,
-        )
+        connection = self.connector.connection
+        if connection.in_transaction():
+            connection.execute(insert_sql, records)
+        else:
+            # Insert the whole batch in a single transaction, which is committed once
+            # and rolled back if any insert fails.
+            with connection.begin():
+                connection.execute(insert_sql, records)
         if isinstance(records, list):
             return len(records)  # If list, we can quickly return record count.
 
@@ -5,6 +5,7 @@ import copy
 import datetime
 import json
 import logging
+import sys
 from os import PathLike
 from pathlib import Path
 from types import MappingProxyType
@@ -104,6 +105,7 @@ class Stream(metaclass=abc.ABCMeta):
         self.logger: logging.Logger = tap.logger
         self.tap_name: str = tap.name
         self._config: dict = dict(tap.config)
+        self._config_proxy: Mapping[str, Any] = MappingProxyType(self._config)
         self._tap = tap
         self._tap_state = tap.state
         self._tap_input_catalog: Optional[Catalog] = None
@@ -530,7 +532,7 @@ class Stream(metaclass=abc.ABCMeta):
         Returns:
             A frozen (read-only) config dictionary map.
         """
-        return MappingProxyType(self._config)
+        return self._config_proxy
 
     @property
     def tap_stream_id(self) -> str:
@@ -773,7 +775,9 @@ class Stream(metaclass=abc.ABCMeta):
             record: A single stream record.
         """
         for record_message in self._generate_record_messages(record):
-            singer.write_message(record_message)
+            # Unlike `singer.write_message()`, don't flush after every record.
+            # STDOUT is flushed each time a STATE message is written.
+            sys.stdout.write(singer.format_message(record_message) + "\n")
 
     @property
     def _metric_logging_function(self) -> Optional[Callable]:
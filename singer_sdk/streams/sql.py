@@ -426,7 +426,7 @@ class SQLConnector:
             The discovered catalog entries as a list.
         """
         result: List[dict] = []
-        engine = self.create_sqlalchemy_engine()
+        engine = self._engine
         inspected = sqlalchemy.inspect(engine)
         for schema_name in self.get_schema_names(engine, inspected):
             # Iterate through each table and view
@@ -1016,8 +1016,12 @@ class SQLStream(Stream, metaclass=abc.ABCMeta):
                     )
                 )
 
-        for row in self.connector.connection.execute(query):
-            yield dict(row)
+        result = self.connector.connection.execute(query)
+        # Zip column names with row tuples directly rather than going through
+        # the per-row mapping interface.
+        column_names = list(result.keys())
+        for row in result:
+            yield dict(zip(column_names, row))
 
 
 __all__ = ["SQLStream", "SQLConnector"]
@@ -23,7 +23,7 @@ from singer_sdk.helpers.capabilities import (
 )
 from singer_sdk.mapper import PluginMapper
 from singer_sdk.plugin_base import PluginBase
-from singer_sdk.streams import SQLStream, Stream
+from singer_sdk.streams import SQLConnector, SQLStream, Stream
 
 STREAM_MAPS_CONFIG = "stream_maps"
 
@@ -537,6 +537,7 @@ class SQLTap(Tap):
             validate_config: True to require validation of config settings.
         """
         self._catalog_dict: Optional[dict] = None
+        self._tap_connector: Optional[SQLConnector] = None
         super().__init__(
             config=config,
             catalog=catalog,
@@ -545,6 +546,22 @@ class SQLTap(Tap):
             validate_config=validate_config,
         )
 
+    @property
+    def tap_connector(self) -> SQLConnector:
+        """The connector object shared by discovery and all of the tap's streams.
+
+        Reusing a single connector avoids opening a new database connection for each
+        stream.
+
+        Returns:
+            The connector object.
+        """
+        if self._tap_connector is None:
+            self._tap_connector = self.default_stream_class.connector_class(
+                dict(self.config)
+            )
+        return self._tap_connector
+
     @property
     def catalog_dict(self) -> dict:
         """Get catalog dictionary.
@@ -558,7 +575,7 @@ class SQLTap(Tap):
         if self.input_catalog:
             return self.input_catalog.to_dict()
 
-        connector = self.default_stream_class.connector_class(dict(self.config))
+        connector = self.tap_connector
 
         result: Dict[str, List[dict]] = {"streams": []}
         result["streams"].extend(connector.discover_catalog_entries())
@@ -574,6 +591,10 @@ class SQLTap(Tap):
         """
         result: List[Stream] = []
         for catalog_entry in self.catalog_dict["streams"]:
-            result.append(self.default_stream_class(self, catalog_entry))
+            result.append(
+                self.default_stream_class(
+                    self, catalog_entry, connector=self.tap_connector
+                )
+            )
 
         return result
@@ -345,8 +345,8 @@ class Target(PluginBase, SingerReader, metaclass=abc.ABCMeta):
 
         if not do_registration:
             self.logger.debug(
-                f"No changes detected in SCHEMA message for stream '{stream_name}'. "
-                "Ignoring."
+                "No changes detected in SCHEMA message for stream '%s'. Ignoring.",
+                stream_name,
             )
             return
 
@@ -0,0 +1,183 @@
+"""Test sink record handling."""
+
+import datetime
+from typing import Any, Dict, Optional
+
+import pytest
+from dateutil import parser
+
+from singer_sdk import typing as th
+from singer_sdk.helpers._typing import DatetimeErrorTreatmentEnum
+from singer_sdk.sinks import BatchSink
+from singer_sdk.sinks.core import (
+    _parse_iso_timestamp_cached,
+    _parse_timestamp,
+    _parse_timestamp_cached,
+)
+from singer_sdk.target_base import Target
+
+SAMPLE_SCHEMA = th.PropertiesList(
+    th.Property("id", th.IntegerType),
+    th.Property("name", th.StringType),
+    th.Property("updated_at", th.DateTimeType),
+).to_dict()
+
+
+class SinkMock(BatchSink):
+    """A mock Sink class."""
+
+    def process_batch(self, context: dict) -> None:
+        """Do nothing."""
+        pass
+
+
+class TargetMock(Target):
+    """A mock Target class."""
+
+    name = "target-mock"
+    config_jsonschema = th.PropertiesList().to_dict()
+    default_sink_class = SinkMock
+
+
+def _get_sink(config: Optional[Dict[str, Any]] = None) -> SinkMock:
+    target = TargetMock(config=config or {})
+    return target.get_sink("users", schema=SAMPLE_SCHEMA, key_properties=["id"])
+
+
+@pytest.mark.parametrize("cache_parsed_timestamps", [True, False])
+def test_parse_timestamps(cache_parsed_timestamps: bool):
+    sink = _get_sink({"cache_parsed_timestamps": cache_parsed_timestamps})
+    records = [
+        {"id": 1, "name": "a", "updated_at": "2022-01-01T00:00:00+00:00"},
+        {"id": 2, "name": "b", "updated_at": "2022-01-01T00:00:00+00:00"},
+        {"id": 3, "name": "c", "updated_at": None},
+    ]
+    _parse_iso_timestamp_cached.cache_clear()
+    for record in records:
+        sink._validate_and_parse(record)
+
+    expected = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+    assert records[0]["updated_at"] == expected
+    assert records[1]["updated_at"] == expected
+    assert records[2]["updated_at"] is None
+    assert records[0]["name"] == "a"
+
+    cache_hits = _parse_iso_timestamp_cached.cache_info().hits
+    if cache_parsed_timestamps:
+        assert records[0]["updated_at"] is records[1]["updated_at"]
+        assert cache_hits == 1
+    else:
+        assert records[0]["updated_at"] is not records[1]["updated_at"]
+        assert cache_hits == 0
+
+
+def test_parse_timestamp_cached_skips_dateutil_values():
+    assert _parse_timestamp_cached("Jan 5") is not _parse_timestamp_cached("Jan 5")
+    assert _parse_timestamp_cached("2022-01-05") is _parse_timestamp_cached(
+        "2022-01-05"
+    )
+
+
+def test_parse_invalid_timestamp():
+    sink = _get_sink()
+    with pytest.raises(ValueError, match="Could not parse value"):
+        sink._parse_timestamps_in_record(
+            {"id": 1, "updated_at": "not a date"},
+            schema=sink.schema,
+            treatment=DatetimeErrorTreatmentEnum.ERROR,
+        )
+
+
+def test_datelike_fields():
+    sink = _get_sink()
+    assert sink._datelike_fields == [("updated_at", "date-time")]
+
+
+def test_datelike_fields_with_record_metadata():
+    sink = _get_sink({"add_record_metadata": True})
+    assert sink._datelike_fields == [
+        ("updated_at", "date-time"),
+        ("_sdc_extracted_at", "date-time"),
+        ("_sdc_received_at", "date-time"),
+        ("_sdc_batched_at", "date-time"),
+        ("_sdc_deleted_at", "date-time"),
+    ]
+
+
+def test_add_sdc_metadata_to_record():
+    sink = _get_sink({"add_record_metadata": True})
+    message = {"time_extracted": "2022-01-01T00:00:00+00:00", "version": 1}
+    batch_start_time = datetime.datetime(2022, 1, 2, 3, 4, 5)
+
+    batch_records = [{"id": 1}, {"id": 2}]
+    for record in batch_records:
+        sink._add_sdc_metadata_to_record(
+            record, message, {"batch_start_time": batch_start_time}
+        )
+    assert batch_records[0]["_sdc_batched_at"] == "2022-01-02T03:04:05"
+    assert batch_records[1]["_sdc_batched_at"] == "2022-01-02T03:04:05"
+    assert batch_records[0]["_sdc_extracted_at"] == message["time_extracted"]
+    assert batch_records[0]["_sdc_deleted_at"] is None
+    assert batch_records[0]["_sdc_table_version"] == 1
+
+    next_batch_start_time = datetime.datetime(2022, 1, 2, 3, 9, 0)
+    next_record: Dict[str, Any] = {"id": 3}
+    sink._add_sdc_metadata_to_record(
+        next_record, message, {"batch_start_time": next_batch_start_time}
+    )
+    assert next_record["_sdc_batched_at"] == "2022-01-02T03:09:00"
+
+    record: Dict[str, Any] = {"id": 4}
+    sink._add_sdc_metadata_to_record(record, message, {})
+    assert record["_sdc_batched_at"] == record["_sdc_received_at"]
+
+
+def test_validate_and_parse_without_datelike_fields(monkeypatch):
+    target = TargetMock(config={})
+    schema = th.PropertiesList(
+        th.Property("id", th.IntegerType),
+        th.Property("name", th.StringType),
+    ).to_dict()
+    sink = target.get_sink("numbers", schema=schema, key_properties=["id"])
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Timestamps should not be parsed")
+
+    monkeypatch.setattr(sink, "_parse_timestamps_in_record", fail)
+    record = sink._validate_and_parse({"id": 1, "name": "2022-01-01"})
+    assert record == {"id": 1, "name": "2022-01-01"}
+    assert sink._datelike_fields == []
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2022-01-01",
+        "2022-01-01T12:34:56",
+        "2022-01-01T12:34:56.123456+02:00",
+        "2022-01-01T12:34:56Z",
+        "2022-01-01T12:34:56.1Z",
+        "Jan 1 2022 12:34:56",
+        "2022-01-01_12:34:56",
+        "2022-01-01X12:34:56",
+        "2022-01-01/12:34:56",
+    ],
+)
+def test_parse_timestamp(value: str):
+    try:
+        expected = parser.parse(value)
+    except ValueError:
+        with pytest.raises(ValueError):
+            _parse_timestamp(value)
+    else:
+        assert _parse_timestamp(value) == expected
+
+
+def test_parse_timestamps_with_unknown_property():
+    sink = _get_sink()
+    record = {"id": 1, "updated_at": "2022-01-01", "extra": "2022-01-01"}
+    sink._parse_timestamps_in_record(
+        record, schema=sink.schema, treatment=DatetimeErrorTreatmentEnum.ERROR
+    )
+    assert record["updated_at"] == datetime.datetime(2022, 1, 1)
+    assert record["extra"] == "2022-01-01"
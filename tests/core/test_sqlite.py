@@ -8,11 +8,12 @@ from typing import Dict, cast
 from uuid import uuid4
 
 import pytest
+import sqlalchemy
 
 from samples.sample_tap_sqlite import SQLiteConnector, SQLiteTap
 from samples.sample_target_csv.csv_target import SampleTargetCSV
 from samples.sample_target_sqlite import SQLiteTarget
-from singer_sdk import SQLStream
+from singer_sdk import SQLSink, SQLStream
 from singer_sdk import typing as th
 from singer_sdk.helpers._singer import Catalog, MetadataMapping, StreamMetadata
 from singer_sdk.tap_base import SQLTap
@@ -152,6 +153,13 @@ def test_sqlite_discovery(sqlite_sample_tap: SQLTap):
     assert stream.primary_keys == ["c1"]
 
 
+def test_sqlite_streams_share_connector(sqlite_sample_tap: SQLTap):
+    streams = [cast(SQLStream, s) for s in sqlite_sample_tap.streams.values()]
+    assert streams
+    for stream in streams:
+        assert stream.connector is sqlite_sample_tap.tap_connector
+
+
 def test_sqlite_input_catalog(sqlite_sample_tap: SQLTap):
     sqlite_sample_tap.sync_all()
     stream = cast(SQLStream, sqlite_sample_tap.streams["main-t1"])
@@ -255,6 +263,42 @@ def test_sync_sqlite_to_sqlite(
     assert line_num > 0, "No lines read."
 
 
+def test_sqlite_bulk_insert_transaction(sqlite_sample_target: SQLTarget):
+    schema = th.PropertiesList(
+        th.Property("id", th.IntegerType),
+        th.Property("name", th.StringType),
+    ).to_dict()
+    sink = cast(
+        SQLSink,
+        sqlite_sample_target.get_sink("people", schema=schema, key_properties=["id"]),
+    )
+    sink.connector.prepare_table(
+        full_table_name=sink.full_table_name, primary_keys=["id"], schema=schema
+    )
+    connection = sink.connector.connection
+    events = []
+    for name in ("begin", "commit", "rollback"):
+        sqlalchemy.event.listen(
+            connection, name, lambda *_, name=name: events.append(name)
+        )
+
+    # Without an open transaction, the batch is wrapped in its own transaction.
+    sink.bulk_insert_records(
+        sink.full_table_name, schema, [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+    )
+    assert events == ["begin", "commit"]
+
+    # With an open transaction, the batch joins it and is rolled back with it.
+    events.clear()
+    transaction = connection.begin()
+    sink.bulk_insert_records(sink.full_table_name, schema, [{"id": 3, "name": "c"}])
+    transaction.rollback()
+    assert events == ["begin", "rollback"]
+
+    result = connection.execute(f"SELECT COUNT(*) FROM {sink.full_table_name}")
+    assert result.scalar() == 2
+
+
 def test_sqlite_column_addition(sqlite_sample_target: SQLTarget):
     """End-to-end-to-end test for SQLite tap and target.
 